@@ -67,6 +67,16 @@ class Backend(metaclass=ABCMeta):
     def write_param(self, param, value):
         """Update parameter into control system."""
 
+    def write_params(self, params):
+        """Update multiple ``(param, value)`` pairs into the control system.
+        The changes take effect with the next call to :meth:`execute`.
+
+        Backends that can send all values in one call (or validate them
+        before writing any) should override this method."""
+        write = self.write_param
+        for param, value in params:
+            write(param, value)
+
     @abstractmethod
     def get_beam(self):
         """
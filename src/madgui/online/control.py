@@ -10,10 +10,10 @@ __all__ = [
 ]
 
 import logging
+from functools import partial
 from importlib import import_module
 import time
 
-import numpy as np
 from PyQt5.QtCore import QTimer
 
 from madgui.util.signal import Signal
@@ -22,6 +22,9 @@ from madgui.util.collections import Bool, List
 
 # TODO: catch exceptions and display error messages
 
+# MAD-X base types of elements that are read out as monitors:
+MONITOR_TYPES = frozenset({'monitor', 'hmonitor', 'vmonitor', 'instrument'})
+
 
 class Control:
 
@@ -45,6 +48,10 @@ class Control:
         self.has_sequence = self.is_connected & self.model
         self._config = config = session.config.online_control
         self._settings = config['settings']
+        self._knobs = None
+        self._knobs_model = None
+        self._watch_model(self.model())
+        self.model.changed.connect(self._watch_model)
         self._on_model_changed()
         self.set_backend(config.backend)
 
@@ -87,12 +94,12 @@ class Control:
 
     def _on_model_changed(self, model=None):
         model = model or self.model()
+        self._invalidate_knobs()
         elems = self.is_connected() and model and model.elements or ()
         self.sampler.monitors = [
             elem.name
             for elem in elems
-            if elem.base_name.lower().endswith('monitor')
-            or elem.base_name.lower() == 'instrument'
+            if elem.base_name.lower() in MONITOR_TYPES
         ]
 
     def export_settings(self):
@@ -100,16 +107,37 @@ class Control:
             return self.backend.export_settings()
         return self._settings
 
+    def _watch_model(self, model):
+        """Drop the cached knobs, and keep dropping them whenever ``model``
+        is updated (e.g. after changes to its globals)."""
+        self._invalidate_knobs()
+        if self._knobs_model is not model:
+            if self._knobs_model:
+                self._knobs_model.updated.disconnect(self._invalidate_knobs)
+            if model:
+                model.updated.connect(self._invalidate_knobs)
+            self._knobs_model = model
+
+    def _invalidate_knobs(self):
+        self._knobs = None
+
     def get_knobs(self):
-        """Get dict of lowercase name → :class:`ParamInfo`."""
-        if not self.model():
+        """Get dict of lowercase name → :class:`ParamInfo`.
+
+        The result is cached until the model, its globals, or the backend
+        change."""
+        model = self.model()
+        if not model:
             return {}
-        return {
-            knob: info
-            for knob in self.model().export_globals()
-            for info in [self.backend.param_info(knob)]
-            if info
-        }
+        if self._knobs is None:
+            param_info = self.backend.param_info
+            self._knobs = {
+                knob: info
+                for knob in model.export_globals()
+                for info in [param_info(knob)]
+                if info
+            }
+        return dict(self._knobs)
 
     # TODO: unify export/import dialog -> "show knobs"
     # TODO: can we drop the read-all button in favor of automatic reads?
@@ -127,10 +155,12 @@ class Control:
     def _show_sync_dialog(self, widget, apply):
         from madgui.online.dialogs import SyncParamItem
         from madgui.widget.dialog import Dialog
-        model, live = self.model(), self.backend
+        model_read = self.model().read_param
+        knobs = self.get_knobs()
+        live_values = self.read_params(knobs)
         widget.data = [
-            SyncParamItem(info, live.read_param(name), model.read_param(name))
-            for name, info in self.get_knobs().items()
+            SyncParamItem(info, live_values.get(name), model_read(name))
+            for name, info in knobs.items()
         ]
         widget.data_key = 'acs_parameters'
         dialog = Dialog(self.session.window())
@@ -138,7 +168,8 @@ class Control:
         dialog.serious.addCustomButton('Sync Model',
                                        self.on_sync_model(self, dialog))
         dialog.serious.updateButtons()
-        dialog.accepted.connect(apply)
+        # pass on the knobs, so they don't need to be queried again:
+        dialog.accepted.connect(partial(apply, list(knobs)))
         dialog.show()
         return dialog
 
@@ -158,17 +189,17 @@ class Control:
             self.widget.close()
 
     def read_all(self, knobs=None):
-        live = self.backend
+        knobs = knobs or self.get_knobs()
+        values = self.read_params(knobs)
         self.model().write_params([
-            (knob, live.read_param(knob))
-            for knob in knobs or self.get_knobs()
+            (knob, values.get(knob)) for knob in knobs
         ], "Read params from online control")
 
     def write_all(self, knobs=None):
-        model = self.model()
+        read = self.model().read_param
+        knobs = knobs or self.get_knobs()
         self.write_params([
-            (knob, model.read_param(knob))
-            for knob in knobs or self.get_knobs()
+            (knob, read(knob)) for knob in knobs
         ])
 
     def on_read_beam(self):
@@ -219,14 +250,17 @@ class Control:
     # helper functions
 
     def write_params(self, params):
-        write = self.backend.write_param
-        for param, value in params:
-            write(param, value)
+        self.backend.write_params(list(params))
         self.backend.execute()
 
     def read_param(self, name):
         return self.backend.read_param(name)
 
+    def read_params(self, names):
+        """Read multiple parameters with a single backend call. Return dict
+        ``{name: value}``, missing unreadable parameters."""
+        return self.backend.read_params(list(names))
+
 
 class BeamSampler:
 
@@ -239,16 +273,38 @@ class BeamSampler:
     updated = Signal([int, dict])
 
     def __init__(self, control, monitors=()):
-        self.monitors = monitors
         self._control = control
         self._timer = QTimer()
         self._timer.timeout.connect(self._poll)
         self._timer.start(500)
+        self._monitors = []
         self._confirmed = {}
         self._candidate = None
         self._confirmed_time = 0
         self._candidate_time = None
         self.readouts_list = List()
+        self.monitors = monitors
+
+    @property
+    def monitors(self):
+        """List of monitor names to be polled."""
+        return self._monitors
+
+    @monitors.setter
+    def monitors(self, monitors):
+        monitors = list(monitors)
+        if monitors == self._monitors:
+            return
+        self._monitors = monitors
+        # Keep the readouts of monitors that are still present, and drop
+        # the others, so we can show the new list without reading again:
+        names = {mon.lower() for mon in monitors}
+        self._confirmed = {
+            k: v for k, v in self._confirmed.items()
+            if k.lower() in names
+        }
+        self._candidate = None
+        self.readouts_list[:] = self.fetch(monitors)
 
     @property
     def readouts(self):
@@ -299,5 +355,5 @@ class MonitorReadout:
         self.envy = envy = values.get('envy')
         self.valid = (envx is not None and envx > 0 and
                       envy is not None and envy > 0 and
-                      not np.isclose(posx, -9.999) and
-                      not np.isclose(posy, -9.999))
+                      abs(posx + 9.999) > 1e-4 and
+                      abs(posy + 9.999) > 1e-4)
@@ -13,7 +13,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QLabel, QWidget
 
-from madgui.util.unit import change_unit, get_raw_label
+from madgui.util.unit import change_unit, get_raw_label, from_config
 from madgui.util.layout import VBoxLayout
 from madgui.util.qt import bold
 from madgui.widget.tableview import TableView, TableItem
@@ -25,9 +25,11 @@ class SyncParamItem:
     def __init__(self, param, acs_value, mad_value):
         self.param = param
         self.name = param.name
-        self.unit = get_raw_label(param.ui_unit)
-        self.acs_value = change_unit(acs_value, param.unit, param.ui_unit)
-        self.mad_value = change_unit(mad_value, param.unit, param.ui_unit)
+        # parse the unit strings only once for both values:
+        unit, ui_unit = from_config(param.unit), from_config(param.ui_unit)
+        self.unit = get_raw_label(ui_unit)
+        self.acs_value = change_unit(acs_value, unit, ui_unit)
+        self.mad_value = change_unit(mad_value, unit, ui_unit)
 
 
 class SyncParamWidget(QWidget):
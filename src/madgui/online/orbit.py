@@ -11,7 +11,11 @@ __all__ = [
     'fit_initial_orbit',
 ]
 
+from itertools import accumulate
+
 import numpy as np
+from scipy.linalg import lstsq
+from scipy.linalg.lapack import dposv
 
 
 class Readout:
@@ -37,18 +41,20 @@ def fit_particle_readouts(model, readouts, to='#s'):
     ]
     readouts = sorted(readouts, key=lambda r: index(r.name))
     from_ = readouts[0].name
-    return fit_particle_orbit(model, readouts, [
-        model.sectormap(from_, r.name)
-        for r in readouts
-    ], to=to)
+    # Fetch the maps between consecutive readouts with a single call and
+    # accumulate them, rather than computing each [from_, r] map separately:
+    secmaps = [model.sectormap(from_)] + model.get_transfer_maps(
+        [r.name for r in readouts])
+    secmaps = list(accumulate(secmaps, lambda a, b: np.dot(b, a)))
+    return fit_particle_orbit(model, readouts, secmaps, to=to)
 
 
 def fit_particle_orbit(model, records, secmaps, from_=None, to='#s'):
 
-    (x, px, y, py), chi_squared, singular = fit_initial_orbit([
-        (secmap[:, :6], secmap[:, 6], (record.posx, record.posy))
-        for record, secmap in zip(records, secmaps)
-    ])
+    secmaps = np.asarray(secmaps, dtype=float)
+    (x, px, y, py), chi_squared, singular = _fit_initial_orbit(
+        secmaps[:, :, :6], secmaps[:, :, 6],
+        [(record.posx, record.posy) for record in records])
 
     if from_ is None:
         from_ = records[0].name
@@ -87,9 +93,42 @@ def fit_initial_orbit(records, rcond=1e-6):
 
     Returns:    [x,px,y,py],    chi_squared,    underdetermined
     """
-    T_, K_, Y_ = zip(*records)
-    T = np.vstack([T[[0, 2]] for T in T_])[:, :4]
-    K = np.hstack([K[[0, 2]] for K in K_])
-    Y = np.hstack(Y_)
-    x, residuals, rank, singular = np.linalg.lstsq(T, Y-K, rcond=rcond)
-    return x, sum(residuals), (rank < len(x))
+    return _fit_initial_orbit(*zip(*records), rcond=rcond)
+
+
+def _fit_initial_orbit(T, K, Y, rcond=1e-6):
+    """Same as :func:`fit_initial_orbit`, but with the sectormaps, kicks
+    and measurements passed as separate (stacked) sequences."""
+    # Stack into (N, rows, cols) arrays once, then select the x/y rows of all
+    # records at the same time:
+    T = np.asarray(T, dtype=float)[:, (0, 2), :4].reshape(-1, 4)
+    K = np.asarray(K, dtype=float)[:, (0, 2)].ravel()
+    Y = np.asarray(Y, dtype=float).ravel()
+    b = Y - K
+    # Solve the (4×4) normal equations, unless T is rank deficient with
+    # respect to `rcond`. The singular values of T are the square roots of
+    # the eigenvalues of TᵀT:
+    A = T.T @ T
+    eigvals = np.linalg.eigvalsh(A)
+    if eigvals[0] > rcond**2 * eigvals[-1]:
+        # Call LAPACK's Cholesky solver directly for this small fixed-size
+        # system; info != 0 means A is not positive definite:
+        _, x, info = dposv(A, T.T @ b)
+        if info == 0:
+            return x, _chi_squared(T, b, x), False
+    # Fall back to a rank revealing least squares solver. QR with column
+    # pivoting (gelsy) is cheaper than the default SVD based driver here,
+    # but does not report residues, so compute them ourselves:
+    x, _, rank, _ = lstsq(
+        T, b, cond=rcond, lapack_driver='gelsy', check_finite=False)
+    singular = rank < len(x)
+    return x, (0 if singular else _chi_squared(T, b, x)), singular
+
+
+def _chi_squared(T, b, x):
+    """Sum of squared residuals of ``T x = b``. Like ``np.linalg.lstsq``,
+    report 0 if the system is not overdetermined."""
+    if len(b) <= len(x):
+        return 0
+    residual = b - T @ x
+    return residual @ residual
@@ -75,6 +75,10 @@ class Corrector(Matcher):
         self.strategy = Boxed('orm')
         self.saved_optics = History()
         self.online_optic = {}
+        self._orm_pinv_key = None
+        self._orm_pinv_val = None
+        self._secmaps_key = (None, None)
+        self._secmaps_val = None
         # for ORM
         kick_elements = ('hkicker', 'vkicker', 'kicker', 'sbend')
         self.all_kickers = [
@@ -95,7 +99,7 @@ class Corrector(Matcher):
         elements = self.model.elements
         self.selected = config
         monitors = sorted(config['monitors'], key=elements.index)
-        last_mon = max(map(elements.index, monitors), default=0)
+        last_mon = elements.index(monitors[-1]) if monitors else 0
 
         knob_elems = {}
         for elem in elements:
@@ -150,7 +154,7 @@ class Corrector(Matcher):
             for elem in targets
             for x, y in [self.objective_values.get(elem, (0, 0))]
         ]
-        self.monitors[:] = sorted(monitors, key=elements.index)
+        self.monitors[:] = monitors
         fit_elements = targets + list(self.monitors) + list(self.optic_elems)
         self.fit_range = (min(fit_elements, key=elements.index, default=0),
                           max(fit_elements, key=elements.index, default=0))
@@ -248,9 +252,7 @@ class Corrector(Matcher):
 
     def current_orbit_records(self):
         model = self.model
-        start = self.fit_range[0]
-        secmaps = model.get_transfer_maps([start] + list(self.monitors))
-        secmaps = list(accumulate(secmaps, lambda a, b: np.dot(b, a)))
+        secmaps = self._orbit_secmaps()
         optics = {k: model.globals[k] for k in self._knobs}
         readouts = {r.name.lower(): r for r in self.readouts}
         return [
@@ -258,6 +260,21 @@ class Corrector(Matcher):
             for monitor, secmap in zip(self.monitors, secmaps)
         ]
 
+    def _orbit_secmaps(self):
+        """Return the sectormaps from the start of the fit range to each
+        monitor. The result is reused until the model's sectormaps are
+        recomputed or the monitor selection changes."""
+        model = self.model
+        table = model.sector()
+        elems = (self.fit_range[0],) + tuple(self.monitors)
+        cached_table, cached_elems = self._secmaps_key
+        if cached_table is not table or cached_elems != elems:
+            secmaps = model.get_transfer_maps(elems)
+            self._secmaps_val = list(
+                accumulate(secmaps, lambda a, b: np.dot(b, a)))
+            self._secmaps_key = (table, elems)
+        return self._secmaps_val
+
     def compute_steerer_corrections(self):
         strats = {
             'match': self._compute_steerer_corrections_match,
@@ -323,14 +340,22 @@ class Corrector(Matcher):
             i for i, (elem, axis) in enumerate(product(self.monitors, 'xy'))
             if (elem.lower(), axis) in targets
         ]
-        dvar = np.linalg.lstsq(
-            orm[S, :], deltas, rcond=1e-10)[0]
+        dvar = self._orm_pinv(orm[S, :]) @ deltas
         globals_ = self.model.globals
         return {
             var.lower(): globals_[var] + delta
             for var, delta in zip(self.variables, dvar)
         }
 
+    def _orm_pinv(self, orm):
+        """Return the pseudo-inverse of the given response matrix. The result
+        is reused as long as the matrix does not change."""
+        key = (orm.shape, orm.tobytes())
+        if self._orm_pinv_key != key:
+            self._orm_pinv_key = key
+            self._orm_pinv_val = np.linalg.pinv(orm, rcond=1e-10)
+        return self._orm_pinv_val
+
     def _get_constraints(self):
         model = self.model
         elements = model.elements
@@ -17,6 +17,7 @@ __all__ = [
 
 import math
 import logging
+from functools import lru_cache, partial
 from types import SimpleNamespace
 
 from madgui.util.yaml import load_resource
@@ -33,16 +34,19 @@ ELEM_STYLES = CONFIG['element_style']
 
 def plot_curve(axes, data, x_name, y_name, style, label=None):
     """Plot a TWISS parameter curve model into a 2D figure."""
-    def get_xydata():
-        table = data() if callable(data) else data
-        xdata = _get_curve_data(table, x_name)
-        ydata = _get_curve_data(table, y_name)
-        if xdata is None or ydata is None:
-            return (), ()
-        return xdata, ydata
+    get_xydata = partial(_get_xydata, data, x_name, y_name)
     return plot_line(axes, get_xydata, label=label, **style)
 
 
+def _get_xydata(data, x_name, y_name):
+    table = data() if callable(data) else data
+    xdata = _get_curve_data(table, x_name)
+    ydata = _get_curve_data(table, y_name)
+    if xdata is None or ydata is None:
+        return (), ()
+    return xdata, ydata
+
+
 def plot_element_indicators(ax, elements, elem_styles=ELEM_STYLES,
                             default_style=None, effects=None, **defaults):
     """Plot element indicators, i.e. create lattice layout plot."""
@@ -71,7 +75,6 @@ def plot_element_indicator(ax, elem, elem_styles=ELEM_STYLES,
     if style is None:
         return LineBundle()
 
-    axes_dirs = {n[-1] for n in ax.y_name} & set("xy")
     # sigmoid flavor with convenient output domain [-1,+1]:
     sigmoid = math.tanh
 
@@ -104,6 +107,9 @@ def plot_element_indicator(ax, elem, elem_styles=ELEM_STYLES,
         ydis = sigmoid(kick) * 0.1
         style['ymin'] += ydis
         style['ymax'] += ydis
+        axes_dirs = getattr(ax, 'axes_dirs', None)
+        if axes_dirs is None:
+            axes_dirs = {n[-1] for n in ax.y_name} & set("xy")
         if axis not in axes_dirs:
             style['alpha'] = 0.2
 
@@ -162,9 +168,7 @@ def _selection_effects(style):
     return dict(
         style,
         color=mpl_colors.hsv_to_rgb((h, s, v)),
-        path_effects=[
-            pe.withStroke(linewidth=2, foreground='#000000', alpha=1.0),
-        ],
+        path_effects=_stroke(linewidth=2, foreground='#000000', alpha=1.0),
     )
 
 
@@ -176,9 +180,7 @@ def _hover_effects(style):
     return dict(
         style,
         color=mpl_colors.hsv_to_rgb((h, s, v)),
-        path_effects=[
-            pe.withStroke(linewidth=1, foreground='#000000', alpha=1.0),
-        ],
+        path_effects=_stroke(linewidth=1, foreground='#000000', alpha=1.0),
     )
 
 
@@ -216,6 +218,12 @@ def ax_label(label, unit):
 
 
 def with_outline(style, linewidth=6, foreground='w', alpha=0.7):
-    return dict(style, path_effects=[
-        pe.withStroke(linewidth=linewidth, foreground=foreground, alpha=alpha),
-    ])
+    return dict(style, path_effects=_stroke(
+        linewidth=linewidth, foreground=foreground, alpha=alpha))
+
+
+@lru_cache(maxsize=None)
+def _stroke(**kwargs):
+    """Return path effects for an outline stroke. Stroke effects are
+    stateless, so the same instances can be shared by all artists."""
+    return (pe.withStroke(**kwargs),)
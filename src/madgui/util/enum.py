@@ -7,6 +7,8 @@ __all__ = [
     'make_enum',
 ]
 
+import sys
+
 
 # Metaclass for creating enum classes:
 class EnumMeta(type):
@@ -26,12 +28,20 @@ class EnumMeta(type):
 # Enum base class
 class Enum:
 
+    __slots__ = ('value',)
+
     def __init__(self, value):
-        preset = value.lower() in self._lower
-        if not preset and self._strict:
+        # fast path for values that are already in canonical case (store
+        # the interned string, not the caller's copy):
+        canonical = self._values_map.get(value)
+        if canonical is not None:
+            self.value = canonical
+            return
+        preset = self._lower.get(value.lower())
+        if preset is None and self._strict:
             raise ValueError("{} does not allow value {!r}\nOnly: {}"
                              .format(self.__class__, value, self._values))
-        self.value = self._lower[value.lower()] if preset else value
+        self.value = value if preset is None else preset
 
     def __str__(self):
         return self.value
@@ -42,11 +52,24 @@ class Enum:
     def __format__(self, spec):
         return self.value
 
+    # The values are interned (see `make_enum`), so that comparing equal
+    # values usually boils down to an identity check:
+
+    def __eq__(self, other):
+        if type(self) is type(other):
+            return self.value == other.value
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.value)
+
 
 def make_enum(name, values, strict=True):
-    values = tuple(values)
+    values = tuple(map(sys.intern, values))
     return EnumMeta(str(name), (Enum,), {
+        '__slots__': (),
         '_values': values,
+        '_values_map': {v: v for v in values},
         '_lower': {v.lower(): v for v in values},
         '_strict': strict,
     })
@@ -18,6 +18,9 @@ import functools
 
 # class utils
 
+_MISSING = object()
+
+
 def memoize(func):
     """
     Decorator for cached method that remembers its result from the first
@@ -53,10 +56,9 @@ def memoize(func):
     @functools.wraps(func)
     def get(self, *args, **kwargs):
         if not (args or kwargs):
-            try:
-                return getattr(self, key)
-            except AttributeError:
-                pass
+            val = self.__dict__.get(key, _MISSING)
+            if val is not _MISSING:
+                return val
         val = func(self)
         setattr(self, key, val)
         return val
@@ -65,11 +67,7 @@ def memoize(func):
 
 def invalidate(obj, func):
     """Invalidate cache for memoized function."""
-    key = '_' + func
-    try:
-        delattr(obj, key)
-    except AttributeError:
-        pass
+    obj.__dict__.pop('_' + func, None)
 
 
 def cachedproperty(func):
@@ -184,7 +184,7 @@ class Property:
 
     @property
     def _has(self):
-        return hasattr(self, '_val')
+        return '_val' in self.__dict__
 
     def _get(self):
         return self._val
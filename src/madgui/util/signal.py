@@ -48,12 +48,10 @@ class Signal:
     def __get__(self, instance, owner):
         if instance is None:    # access via class
             return self
-        try:
-            return getattr(instance, self._attr)
-        except AttributeError:
-            signal = BoundSignal()
-            setattr(instance, self._attr, signal)
-            return signal
+        signal = instance.__dict__.get(self._attr)
+        if signal is None:
+            signal = instance.__dict__[self._attr] = BoundSignal()
+        return signal
 
 
 class BoundSignal:
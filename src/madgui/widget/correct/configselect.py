@@ -1,8 +1,7 @@
-import yaml
-
 from PyQt5.QtCore import pyqtSlot as slot
 from PyQt5.QtWidgets import QWidget, QMessageBox
 
+from madgui.util import yaml
 from madgui.util.qt import load_ui
 from madgui.widget.edit import TextEditDialog
 
@@ -1,5 +1,3 @@
-import numpy as np
-
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QAbstractItemView
@@ -85,12 +83,26 @@ class ResultTable(TableView):
 
     def set_corrector(self, corrector):
         self.corrector = corrector
+        self._ui_scales = {}
         self.set_viewmodel(self.get_steerer_row, corrector.variables)
 
+    def to_ui(self, info, value):
+        """Convert a knob value to its UI unit. The conversion factor is
+        computed only once per unit pair."""
+        if value is None:
+            return None
+        units = (info.unit, info.ui_unit)
+        scale = self._ui_scales.get(units)
+        if scale is None:
+            scale = self._ui_scales[units] = change_unit(1.0, *units)
+        return value * scale
+
     def get_steerer_row(self, i, v) -> ("Steerer", "Now", "To Be", "Unit"):
         initial = self.corrector.online_optic.get(v.lower())
         matched = self.corrector.saved_optics().get(v.lower())
-        changed = matched is not None and not np.isclose(initial, matched)
+        # same tolerance as `np.isclose`, but cheaper for scalars:
+        changed = (matched is not None and
+                   abs(initial - matched) > 1e-8 + 1e-5 * abs(matched))
         style = {
             # 'foreground': QColor(Qt.red),
             'font': bold(),
@@ -98,8 +110,8 @@ class ResultTable(TableView):
         info = self.corrector._knobs[v.lower()]
         return [
             TableItem(v),
-            TableItem(change_unit(initial, info.unit, info.ui_unit)),
-            TableItem(change_unit(matched, info.unit, info.ui_unit),
+            TableItem(self.to_ui(info, initial)),
+            TableItem(self.to_ui(info, matched),
                       set_value=self.set_steerer_value,
                       delegate=delegates[float], **style),
             TableItem(get_raw_label(info.ui_unit)),
@@ -64,13 +64,15 @@ class OpticsTable(QWidget):
         acs = ctrl.backend.beamoptikdll
         values, channels = acs.GetMEFIValue()
         vacc = acs.GetSelectedVAcc()
+        params = corr.selected['optics']
         try:
             optics = []
             for focus in foci:
                 acs.SelectMEFI(vacc, *channels._replace(focus=focus))
+                readout = ctrl.read_params(params)
                 optics.append({
-                    par.lower(): ctrl.read_param(par)
-                    for par in corr.selected['optics']
+                    par.lower(): readout.get(par)
+                    for par in params
                 })
             corr.optics[:] = optics
         finally:
@@ -14,6 +14,7 @@ import sys
 import traceback
 import logging
 import time
+from bisect import bisect_right
 from collections import namedtuple, deque
 
 from PyQt5.QtCore import Qt
@@ -41,6 +42,12 @@ class RecordInfoBar(LineNumberBar):
 
     def __init__(self, edit, time_format='%H:%M:%S', show_time=True):
         self.records = {}
+        # Sorted list of the keys in `records`, used for bisecting:
+        self._starts = []
+        # Formatted label text per record, and time strings per second, both
+        # cleared when the format changes:
+        self._labels = {}
+        self._time_strs = {}
         self.domains = set()
         self.show_time = show_time
         self.time_format = time_format
@@ -57,12 +64,15 @@ class RecordInfoBar(LineNumberBar):
     def enable_timestamps(self, enable: bool):
         """Turn on display of times, recalculate geometry, and redraw."""
         self.show_time = enable
+        self._labels.clear()
         self.adjustWidth(1)
 
     def set_timeformat(self, format: str):
         """Set a time display format for use with :func:`time.strftime`,
         recalculate geometry, and redraw."""
         self.time_format = format
+        self._labels.clear()
+        self._time_strs.clear()
         self.adjustWidth(1)
 
     def draw_block(self, painter, rect, block, first):
@@ -83,16 +93,31 @@ class RecordInfoBar(LineNumberBar):
             painter.setPen(QColor(Qt.black))
         elif first:
             painter.setPen(QColor(Qt.gray))
-            count = max([c for c in self.records if c <= count], default=None)
+            index = bisect_right(self._starts, count)
+            count = self._starts[index-1] if index else None
         if count in self.records:
-            record = self.records[count]
-            parts = [record.domain]
-            if self.show_time:
-                record_time = time.localtime(record.time)
-                parts.insert(0, time.strftime(self.time_format, record_time))
-            if parts:
-                text = ' '.join(parts) + ':' or ''
-                painter.drawText(rect, Qt.AlignLeft, text)
+            text = self._labels.get(count)
+            if text is None:
+                text = self._labels[count] = self.format_label(
+                    self.records[count])
+            painter.drawText(rect, Qt.AlignLeft, text)
+
+    def format_label(self, record: LogRecord) -> str:
+        """Return the text to be shown next to a record."""
+        parts = [record.domain]
+        if self.show_time:
+            parts.insert(0, self.format_time(record.time))
+        return ' '.join(parts) + ':'
+
+    def format_time(self, timestamp: float) -> str:
+        """Format a timestamp, sharing the result among all records that
+        were emitted within the same second."""
+        second = int(timestamp)
+        text = self._time_strs.get(second)
+        if text is None:
+            text = self._time_strs[second] = time.strftime(
+                self.time_format, time.localtime(second))
+        return text
 
     def calc_width(self, count: int = 0) -> int:
         """Calculate the required widget width in pixels.
@@ -109,6 +134,7 @@ class RecordInfoBar(LineNumberBar):
     def add_record(self, record: LogRecord):
         """Called by :class:`LogWindow` when it adds a visible record."""
         self.records[self._curlen] = record
+        self._starts.append(self._curlen)
         self.domains.add(record.domain)
         self._curlen += record.text.count('\n') + 1
 
@@ -117,6 +143,9 @@ class RecordInfoBar(LineNumberBar):
         displayed records."""
         self._curlen = 0
         self.records.clear()
+        self._starts.clear()
+        self._labels.clear()
+        self._time_strs.clear()
         self.domains.clear()
 
 
@@ -242,51 +271,64 @@ class LogWindow(QFrame):
         self.textctrl.clear()
         self.infobar.clear()
         shown_records = [r for r in self.records if self.enabled(r.domain)]
-        for record in shown_records[-self.maxlen:]:
-            self._append_log(record)
+        # Suppress repaints while reinserting, so that we get only a single
+        # redraw at the end:
+        self.textctrl.setUpdatesEnabled(False)
+        try:
+            self._append_log(shown_records[-self.maxlen:])
+        finally:
+            self.textctrl.setUpdatesEnabled(True)
 
     def append(self, record):
         """Add a :class:`LogRecord`. This can be called by users!"""
         self.records.append(record)
         self._domains.add(record.domain)
         if self.enabled(record.domain):
-            self._append_log(record)
+            self._append_log([record])
 
-    def _append_log(self, record):
-        """Internal method to insert a displayed record into the underlying
+    def _append_log(self, records):
+        """Internal method to insert displayed records into the underlying
         :class:`QPlainTextEdit`."""
-        self.infobar.add_record(record)
-        self._rec_lines.append(record.text.count('\n') + 1)
-
-        # NOTE: For some reason, we must use `setPosition` in order to
-        # guarantee a absolute, fixed selection (at least on linux). It seems
-        # almost if `movePosition(End)` will be re-evaluated at any time the
-        # cursor/selection is used and therefore always point to the end of
-        # the document.
-
-        cursor = QTextCursor(self.textctrl.document())
-        cursor.movePosition(QTextCursor.End)
-        pos0 = cursor.position()
-        cursor.insertText(record.text + '\n')
-        pos1 = cursor.position()
-
-        cursor = QTextCursor(self.textctrl.document())
-        cursor.setPosition(pos0)
-        cursor.setPosition(pos1, QTextCursor.KeepAnchor)
-
-        selection = QTextEdit.ExtraSelection()
-        selection.format = self.formats.get(record.domain, self.default_format)
-        selection.cursor = cursor
-
+        if not records:
+            return
+        document = self.textctrl.document()
         selections = self.textctrl.extraSelections()
-        if selections:
-            # Force the previous selection to end at the current block.
-            # Without this, all previous selections are be updated to span
-            # over the rest of the document, which dramatically impacts
-            # performance because it means that all selections need to be
-            # considered even if showing only the end of the document.
-            selections[-1].cursor.setPosition(pos0, QTextCursor.KeepAnchor)
-        selections.append(selection)
+        for record in records:
+            self.infobar.add_record(record)
+            self._rec_lines.append(record.text.count('\n') + 1)
+
+            # NOTE: For some reason, we must use `setPosition` in order to
+            # guarantee a absolute, fixed selection (at least on linux). It
+            # seems almost if `movePosition(End)` will be re-evaluated at any
+            # time the cursor/selection is used and therefore always point to
+            # the end of the document.
+
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            pos0 = cursor.position()
+            cursor.insertText(record.text + '\n')
+            pos1 = cursor.position()
+
+            cursor = QTextCursor(document)
+            cursor.setPosition(pos0)
+            cursor.setPosition(pos1, QTextCursor.KeepAnchor)
+
+            selection = QTextEdit.ExtraSelection()
+            selection.format = self.formats.get(
+                record.domain, self.default_format)
+            selection.cursor = cursor
+
+            if selections:
+                # Force the previous selection to end at the current block.
+                # Without this, all previous selections are be updated to
+                # span over the rest of the document, which dramatically
+                # impacts performance because it means that all selections
+                # need to be considered even if showing only the end of the
+                # document.
+                selections[-1].cursor.setPosition(
+                    pos0, QTextCursor.KeepAnchor)
+            selections.append(selection)
+
         self.textctrl.setExtraSelections(selections[-self.maxlen:])
         self.textctrl.ensureCursorVisible()
 
@@ -276,13 +276,42 @@ class TableModel(QAbstractItemModel):
         self.parent = None
         self.root = TreeNode(NodeItem(rows=rows, rowitems=rowitems))
 
-    def _refresh(self, *_):
+    def _refresh(self, slice, old_values, new_values):
+        # Avoid a full model reset (which also drops the selection and
+        # rebuilds all view items) if only the values of some rows changed,
+        # and the table stays flat, i.e. its structure is unchanged:
+        rows = range(len(self._rows))[slice]
+        if (len(old_values) == len(new_values) and
+                self._is_flat() and self._will_be_flat(rows)):
+            self.root.invalidate()
+            if rows:
+                self.dataChanged.emit(
+                    self.index(min(rows), 0),
+                    self.index(max(rows), self.columnCount()-1))
+            return
         self.beginResetModel()
         try:
             self.root.invalidate()
         finally:
             self.endResetModel()
 
+    def _is_flat(self):
+        """Check that none of the currently known cells has child rows."""
+        return not any(
+            getattr(cell, '_children', None)
+            for row in getattr(self.root, '_children', ())
+            for cell in getattr(row, '_children', ()))
+
+    def _will_be_flat(self, rows):
+        """Check that the cells for the updated data in the given rows will
+        not have child rows. This does not modify the current tree."""
+        rowitems = self.root.item.rowitems
+        data = self._rows
+        return not any(
+            cell.rows
+            for i in rows
+            for cell in rowitems(i, data[i]))
+
     # data accessors
 
     @property
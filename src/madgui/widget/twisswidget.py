@@ -196,7 +196,7 @@ class TwissFigure:
         self.model = session.model()
         self.config = dict(CONFIG, **session.config.get('twissfigure', {}))
         self.element_style = self.config['element_style']
-        self.monitors = []
+        self.monitors = set()
         # scene
         self.layout_elems = List()
         self.layout_elems.emit_changed_if = lambda old, new: old != new
@@ -254,8 +254,15 @@ class TwissFigure:
     def _on_button_press(self, mpl_event):
         self._mouse_event(self.buttonPress, mpl_event)
 
+    _last_motion = None
+
     def _on_motion_notify(self, mpl_event):
-        self._mouse_event(self.mouseMotion, mpl_event)
+        # Skip the element lookup if nobody is listening, or if the cursor
+        # did not move (in data coordinates) since the last event:
+        pos = (mpl_event.inaxes, mpl_event.xdata, mpl_event.ydata)
+        if self.mouseMotion.handlers and pos != self._last_motion:
+            self._last_motion = pos
+            self._mouse_event(self.mouseMotion, mpl_event)
 
     def _mouse_event(self, signal, mpl_event):
         if mpl_event.inaxes is None:
@@ -309,10 +316,16 @@ class TwissFigure:
             # assuming all curves have the same y units (as they should!!):
             ax.x_unit = ui_units.get(info.xname)
             ax.y_unit = ui_units.get(info.name)
+            # precompute unit labels for the mouse status:
+            ax.x_unit_label = get_raw_label(ax.x_unit)
+            ax.y_unit_label = get_raw_label(ax.y_unit)
             if not self.share_axes:
                 ax.set_ylabel(ax_label(info.label, ax.y_unit))
             # replace formatter method for mouse status:
             ax.format_coord = partial(self.format_coord, ax)
+        for ax in figure.axes:
+            # transverse planes shown in this axes (used by the indicators):
+            ax.axes_dirs = frozenset(n[-1] for n in ax.y_name) & set("xy")
         # TODO: generalize for arbitrary X data:
         self.figure.axes[-1].set_xlabel(ax_label(self.x_label, self.x_unit))
         self.scene_graph.enable(True)
@@ -343,8 +356,8 @@ class TwissFigure:
         # TODO: in some cases, it might be necessary to adjust the
         # precision to the displayed xlim/ylim.
         coord_fmt = "{0:.6f}{1}".format
-        parts = [coord_fmt(x, get_raw_label(ax.x_unit)),
-                 coord_fmt(y, get_raw_label(ax.y_unit))]
+        parts = [coord_fmt(x, ax.x_unit_label),
+                 coord_fmt(y, ax.y_unit_label)]
         elem = self.get_element_by_mouse_position(ax, x)
         if elem:
             name = strip_suffix(elem.node_name, '[0]')
@@ -361,8 +374,11 @@ class TwissFigure:
         # Fuzzy select nearby elements, if they are <= 3px:
         at, L = elem.position, elem.length
         index = elem.index
-        x0_px = axes.transData.transform_point((0, 0))[0]
-        x2pix = lambda x: axes.transData.transform_point((x, 0))[0]-x0_px
+        # The x axis is linear, so the pixel scale follows directly from the
+        # view limits and the axes width (no transform calls needed):
+        xmin, xmax = axes.get_xlim()
+        px_per_unit = axes.bbox.width / (xmax - xmin)
+        x2pix = lambda x: x * px_per_unit
         len_px = x2pix(L)
         if len_px > 5 or elem.base_name == 'drift':
             # max 2px cursor distance:
@@ -405,30 +421,39 @@ class TwissFigure:
     def get_graph_info(self, name, xlim):
         """Get the data for a particular graph."""
         # TODO: use xlim for interpolate
-        conf = self.config['graphs'][name]
-        return PlotInfo(
-            name=name,
-            title=conf['title'],
-            curves=[
-                CurveInfo(table, xname, name, label, style)
-                for (table, xname, name, label, style) in conf['curves']
-            ])
+        return self._graph_infos()[name]
+
+    @memoize
+    def _graph_infos(self):
+        """Parse the graph definitions from the config (only once)."""
+        return {
+            name: PlotInfo(
+                name=name,
+                title=conf['title'],
+                curves=[
+                    CurveInfo(table, xname, yname, label, style)
+                    for (table, xname, yname, label, style) in conf['curves']
+                ])
+            for name, conf in self.config['graphs'].items()
+        }
 
+    @memoize
     def get_graphs(self):
         """Get a list of graph names."""
-        return {name: info['title']
-                for name, info in self.config['graphs'].items()}
+        return {name: info.title
+                for name, info in self._graph_infos().items()}
 
     def get_graph_columns(self):
         """Get a set of all columns used in any graph."""
-        cols = {
-            yname
-            for info in self.config['graphs'].values()
-            for (table, xname, yname, label, style) in info['curves']
-        }
-        cols.add('s')
-        cols.update(self.model.twiss()._cache.keys())
-        return cols
+        return self._static_graph_columns().union(
+            self.model.twiss()._cache.keys())
+
+    @memoize
+    def _static_graph_columns(self):
+        return frozenset({'s'}).union(
+            curve.name
+            for info in self._graph_infos().values()
+            for curve in info.curves)
 
     @property
     def show_indicators(self):
@@ -445,7 +470,7 @@ class TwissFigure:
         return Dialog(self.plot.window(), CurveManager(self))
 
     def show_monitor_readouts(self, monitors):
-        self.monitors = [m.lower() for m in monitors]
+        self.monitors = {m.lower() for m in monitors}
         self.scene_graph.node('monitor_readouts').enable(True)
         self.scene_graph.node('monitor_readouts').invalidate()
         self.draw_idle()
@@ -456,23 +481,18 @@ class TwissFigure:
     def _get_monitor_curve_data(self):
         elements = self.model.elements
         offsets = self.session.config['online_control']['offsets']
-        monitor_data = [
-            {'s': elements[r.name].position,
-             'x': r.posx + dx,
-             'y': r.posy + dy,
-             'envx': r.envx,
-             'envy': r.envy,
-             }
+        names = ['s', 'envx', 'envy', 'x', 'y']
+        rows = [
+            (elements[r.name].position, r.envx, r.envy, r.posx + dx, r.posy + dy)
             for r in self.session.control.sampler.readouts_list
-            for dx, dy in [offsets.get(r.name.lower(), (0, 0))]
-            if r.name.lower() in self.monitors
-            and r.posx is not None
-            and r.posy is not None
+            if r.posx is not None and r.posy is not None
+            for name in [r.name.lower()]
+            if name in self.monitors
+            for dx, dy in [offsets.get(name, (0, 0))]
         ]
-        return {
-            name: np.array([d[name] for d in monitor_data])
-            for name in ['s', 'envx', 'envy', 'x', 'y']
-        }
+        # transpose in a single pass:
+        columns = list(zip(*rows)) or [()] * len(names)
+        return dict(zip(names, map(np.array, columns)))
 
     def add_curve(self, name, data, style):
         item = UserData(name, data, style)
@@ -715,7 +735,7 @@ class InfoTool(CaptureTool):
     def advance_selection(self, move_step):
         selected = self.selection
         if selected:
-            old_el_id = selected.cursor_item
+            old_el_id = selected.cursor_item()
             new_el_id = (old_el_id + move_step) % len(self.model.elements)
             selected.add(new_el_id, replace=True)
 
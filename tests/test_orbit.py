@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+import madgui.online.orbit as orbit
+from madgui.online.orbit import fit_initial_orbit
+
+
+def make_records(num, seed=0):
+    rng = np.random.RandomState(seed)
+    return [
+        (m[:, :6], m[:, 6], tuple(rng.normal(size=2)))
+        for m in rng.normal(size=(num, 7, 7))
+    ]
+
+
+def reference_fit(records, rcond=1e-6):
+    T = np.vstack([t[(0, 2), :4] for t, k, y in records])
+    K = np.hstack([k[[0, 2]] for t, k, y in records])
+    Y = np.hstack([y for t, k, y in records])
+    x, residuals, rank, _ = np.linalg.lstsq(T, Y-K, rcond=rcond)
+    return x, sum(residuals), rank < len(x)
+
+
+def check_fit(records):
+    x, chi_squared, singular = fit_initial_orbit(records)
+    x_ref, chi_squared_ref, singular_ref = reference_fit(records)
+    assert np.allclose(x, x_ref)
+    assert np.isclose(chi_squared, chi_squared_ref)
+    assert singular == singular_ref
+
+
+def test_fit_exactly_determined():
+    records = make_records(2)
+    check_fit(records)
+    assert fit_initial_orbit(records)[1:] == (0, False)
+
+
+def test_fit_overdetermined():
+    records = make_records(8)
+    check_fit(records)
+    assert fit_initial_orbit(records)[1] > 0
+
+
+def test_fit_rank_deficient():
+    m = np.zeros((7, 7))
+    m[0, 0] = m[2, 2] = 1
+    records = [(m[:, :6], m[:, 6], (1.0, 2.0))] * 3
+    check_fit(records)
+    assert fit_initial_orbit(records)[2]
+
+
+@pytest.mark.parametrize('num', [2, 8])
+def test_fit_fallback(monkeypatch, num):
+    # force the least squares fallback for a full rank system:
+    monkeypatch.setattr(orbit, 'dposv', lambda A, b: (None, None, 1))
+    check_fit(make_records(num))